@@ -16,13 +16,22 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json as _stdlib_json
 import logging
 import os
+import random
+import sys
 import time
+import types
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -32,20 +41,107 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
+from urllib.parse import urlencode
 
-try:
+if TYPE_CHECKING:
     import aiohttp
+else:
+    # Imported lazily on first use so `import openibank` stays cheap for
+    # callers that only touch models or build requests offline.
+    aiohttp = None
+
+websockets = None
+
+
+def _load_aiohttp() -> Any:
+    """Import aiohttp on first use."""
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as _aiohttp
+        except ImportError:
+            raise ImportError(
+                "aiohttp is required for the OpeniBank SDK. "
+                "Install it with: pip install aiohttp"
+            ) from None
+        aiohttp = _aiohttp
+    return aiohttp
+
+
+def _load_websockets() -> Any:
+    """Import websockets on first use."""
+    global websockets
+    if websockets is None:
+        try:
+            import websockets as _websockets
+        except ImportError:
+            raise ImportError(
+                "websockets is required for real-time features. "
+                "Install it with: pip install openibank[websocket]"
+            ) from None
+        websockets = _websockets
+    return websockets
+
+
+try:
+    import msgspec
 except ImportError:
-    aiohttp = None  # type: ignore
+    msgspec = None  # type: ignore
 
 try:
-    import websockets
+    import orjson
 except ImportError:
-    websockets = None  # type: ignore
+    orjson = None  # type: ignore
+
+try:
+    import ujson
+except ImportError:
+    ujson = None  # type: ignore
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore
+
+# Fast JSON codec selection, resolved once at import time:
+# msgspec -> orjson -> ujson -> stdlib. The accelerated codecs parse
+# large bodies 2-3x faster than the stdlib and serialize 5-6x faster.
+# The fast-json extra installs msgspec and orjson; ujson is picked up
+# opportunistically when a deployment already ships it. _json_dumps
+# returns str because aiohttp's json_serialize and websockets text
+# frames both want str.
+if msgspec is not None:
+    _json_loads = msgspec.json.decode
+    _json_dumps_bytes = msgspec.json.encode
+
+    def _json_dumps(obj: Any) -> str:
+        return msgspec.json.encode(obj).decode()
+
+elif orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+elif ujson is not None:
+    _json_loads = ujson.loads
+    _json_dumps = ujson.dumps
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return ujson.dumps(obj).encode()
+
+else:
+    _json_loads = _stdlib_json.loads
+    _json_dumps = _stdlib_json.dumps
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return _stdlib_json.dumps(obj).encode()
 
 __version__ = "1.0.0"
 __author__ = "OpeniBank"
@@ -55,6 +151,13 @@ logger = logging.getLogger("openibank")
 
 T = TypeVar("T")
 
+# slots=True halves per-instance memory for bulk deserialization but is
+# only supported by dataclass() on Python 3.10+.
+if sys.version_info >= (3, 10):
+    _SLOTTED: Dict[str, Any] = {"slots": True}
+else:
+    _SLOTTED = {}
+
 
 # =============================================================================
 # Configuration
@@ -80,17 +183,22 @@ class Config:
     timeout: float = 30.0
     max_retries: int = 3
     retry_delay: float = 1.0
+    pool_limit: int = 64
     auto_refresh: bool = True
     debug: bool = False
+    # Long-lived applications should create one aiohttp.ClientSession at
+    # startup and share it here so every client reuses the same
+    # connection pool. The SDK never closes a shared session.
+    shared_session: Optional["aiohttp.ClientSession"] = None
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         """Get the base URL for the current environment."""
         if self.environment == "production":
             return "https://api.openibank.com"
         return "https://sandbox.openibank.com"
 
-    @property
+    @cached_property
     def websocket_url(self) -> str:
         """Get the WebSocket URL for the current environment."""
         if self.environment == "production":
@@ -120,6 +228,8 @@ class Config:
 class OpeniBankError(Exception):
     """Base exception for all OpeniBank errors."""
 
+    __slots__ = ("message", "code", "status_code", "request_id", "details")
+
     def __init__(
         self,
         message: str,
@@ -147,12 +257,14 @@ class OpeniBankError(Exception):
 class AuthenticationError(OpeniBankError):
     """Authentication failed - invalid or expired credentials."""
 
-    pass
+    __slots__ = ()
 
 
 class AuthorizationError(OpeniBankError):
     """Authorization failed - insufficient permissions."""
 
+    __slots__ = ("required_scopes",)
+
     def __init__(
         self,
         message: str,
@@ -166,7 +278,9 @@ class AuthorizationError(OpeniBankError):
 class ValidationError(OpeniBankError):
     """Request validation failed."""
 
-    @dataclass
+    __slots__ = ("errors",)
+
+    @dataclass(**_SLOTTED)
     class FieldError:
         field: str
         message: str
@@ -192,6 +306,8 @@ class ValidationError(OpeniBankError):
 class NotFoundError(OpeniBankError):
     """Resource not found."""
 
+    __slots__ = ("resource_type", "resource_id")
+
     def __init__(
         self,
         message: str,
@@ -207,6 +323,8 @@ class NotFoundError(OpeniBankError):
 class RateLimitError(OpeniBankError):
     """Rate limit exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -220,19 +338,38 @@ class RateLimitError(OpeniBankError):
 class ConflictError(OpeniBankError):
     """Resource conflict (e.g., duplicate)."""
 
-    pass
+    __slots__ = ()
 
 
 class ServerError(OpeniBankError):
     """Internal server error."""
 
-    pass
+    __slots__ = ()
 
 
 class NetworkError(OpeniBankError):
     """Network or connection error."""
 
-    pass
+    __slots__ = ()
+
+
+# Status -> exception dispatch for HTTPClient.request. Statuses not listed
+# here fall back to ServerError (>= 500) or OpeniBankError.
+_ERROR_MAP: Dict[int, Type[OpeniBankError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+    409: ConflictError,
+    429: RateLimitError,
+}
+
+# Extra keyword arguments each exception class pulls from the error body.
+_ERROR_EXTRA_FIELDS: Dict[Type[OpeniBankError], tuple] = {
+    ValidationError: ("errors",),
+    AuthorizationError: ("required_scopes",),
+    NotFoundError: ("resource_type", "resource_id"),
+}
 
 
 # =============================================================================
@@ -240,24 +377,62 @@ class NetworkError(OpeniBankError):
 # =============================================================================
 
 
-@dataclass
+# Shared immutable empties so deserializing a page of N rows does not
+# allocate N empty containers. Callers must assign a fresh container to
+# mutate these fields.
+_EMPTY_DICT: Dict[str, Any] = types.MappingProxyType({})  # type: ignore
+_EMPTY_TUPLE: tuple = ()
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 datetime, caching repeated timestamps."""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=8192)
+def _parse_date(value: str) -> date:
+    """Parse an ISO-8601 date, caching repeated dates.
+
+    Booking and value dates repeat heavily within a transaction page, so
+    most lookups are cache hits.
+    """
+    return date.fromisoformat(value)
+
+
+@dataclass(**_SLOTTED)
 class Amount:
     """Monetary amount with currency."""
 
     amount: str
     currency: str
+    _decimal: Optional[Decimal] = field(
+        default=None, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         # Ensure amount is a string
         self.amount = str(self.amount)
 
+    @property
+    def decimal_value(self) -> Decimal:
+        """Get the exact Decimal value, parsed once per instance."""
+        parsed = self._decimal
+        if parsed is None:
+            parsed = self._decimal = Decimal(self.amount)
+        return parsed
+
     @property
     def value(self) -> float:
-        """Get numeric value."""
-        return float(self.amount)
+        """Get numeric value.
 
+        Deprecated: binary floats round monetary values; use
+        decimal_value instead.
+        """
+        return float(self.decimal_value)
 
-@dataclass
+
+@dataclass(**_SLOTTED)
 class Balance:
     """Account balance."""
 
@@ -269,20 +444,19 @@ class Balance:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Balance":
+        last_updated = data.get("last_updated")
         return cls(
             amount=data.get("amount", "0"),
             currency=data.get("currency", "EUR"),
             type=data.get("type", "available"),
             credit_limit=data.get("credit_limit"),
             last_updated=(
-                datetime.fromisoformat(data["last_updated"])
-                if data.get("last_updated")
-                else None
+                _parse_datetime(last_updated) if last_updated else None
             ),
         )
 
 
-@dataclass
+@dataclass(**_SLOTTED)
 class Account:
     """Bank account."""
 
@@ -301,9 +475,10 @@ class Account:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Account":
-        balance = None
-        if data.get("balance"):
-            balance = Balance.from_dict(data["balance"])
+        raw_balance = data.get("balance")
+        balance = Balance.from_dict(raw_balance) if raw_balance else None
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
 
         return cls(
             id=data["id"],
@@ -317,19 +492,15 @@ class Account:
             institution_id=data.get("institution_id"),
             owner_name=data.get("owner_name"),
             created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if data.get("created_at")
-                else None
+                _parse_datetime(created_at) if created_at else None
             ),
             updated_at=(
-                datetime.fromisoformat(data["updated_at"])
-                if data.get("updated_at")
-                else None
+                _parse_datetime(updated_at) if updated_at else None
             ),
         )
 
 
-@dataclass
+@dataclass(**_SLOTTED)
 class Transaction:
     """Bank transaction."""
 
@@ -346,10 +517,13 @@ class Transaction:
     counterparty_name: Optional[str] = None
     counterparty_iban: Optional[str] = None
     category: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # The factory returns the shared proxy, so no dict is allocated.
+    metadata: Dict[str, Any] = field(default_factory=lambda: _EMPTY_DICT)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Transaction":
+        booking_date = data.get("booking_date")
+        value_date = data.get("value_date")
         return cls(
             id=data["id"],
             account_id=data.get("account_id", ""),
@@ -358,23 +532,61 @@ class Transaction:
             description=data.get("description", ""),
             reference=data.get("reference"),
             booking_date=(
-                date.fromisoformat(data["booking_date"])
-                if data.get("booking_date")
-                else None
+                _parse_date(booking_date) if booking_date else None
             ),
             value_date=(
-                date.fromisoformat(data["value_date"])
-                if data.get("value_date")
-                else None
+                _parse_date(value_date) if value_date else None
             ),
             transaction_type=data.get("transaction_type", "transfer"),
             status=data.get("status", "booked"),
             counterparty_name=data.get("counterparty_name"),
             counterparty_iban=data.get("counterparty_iban"),
             category=data.get("category"),
-            metadata=data.get("metadata", {}),
+            metadata=data.get("metadata") or _EMPTY_DICT,
         )
 
+    @classmethod
+    def from_list(
+        cls, rows: List[Dict[str, Any]]
+    ) -> List["Transaction"]:
+        """Build transactions from a list of dicts in one pass.
+
+        Equivalent to mapping from_dict over the rows, with the date
+        parser and append hoisted to locals so large pages avoid the
+        per-row method dispatch overhead.
+        """
+        parse_date = _parse_date
+        transactions: List[Transaction] = []
+        append = transactions.append
+        for data in rows:
+            booking_date = data.get("booking_date")
+            value_date = data.get("value_date")
+            append(
+                cls(
+                    id=data["id"],
+                    account_id=data.get("account_id", ""),
+                    amount=data.get("amount", "0"),
+                    currency=data.get("currency", "EUR"),
+                    description=data.get("description", ""),
+                    reference=data.get("reference"),
+                    booking_date=(
+                        parse_date(booking_date) if booking_date else None
+                    ),
+                    value_date=(
+                        parse_date(value_date) if value_date else None
+                    ),
+                    transaction_type=data.get(
+                        "transaction_type", "transfer"
+                    ),
+                    status=data.get("status", "booked"),
+                    counterparty_name=data.get("counterparty_name"),
+                    counterparty_iban=data.get("counterparty_iban"),
+                    category=data.get("category"),
+                    metadata=data.get("metadata") or _EMPTY_DICT,
+                )
+            )
+        return transactions
+
 
 @dataclass
 class CreditorAccount:
@@ -405,8 +617,32 @@ class PaymentRequest:
     end_to_end_id: Optional[str] = None
     execution_date: Optional[date] = None
 
+    def to_payload(self) -> Dict[str, Any]:
+        """Build the wire-format payment initiation body."""
+        return {
+            "creditor": {
+                "name": self.creditor.name,
+                "account": {
+                    "iban": self.creditor.account.iban,
+                    "bban": self.creditor.account.bban,
+                },
+            },
+            "amount": {
+                "amount": self.amount.amount,
+                "currency": self.amount.currency,
+            },
+            "debtor_account_id": self.debtor_account_id,
+            "reference": self.reference,
+            "end_to_end_id": self.end_to_end_id,
+            "execution_date": (
+                self.execution_date.isoformat()
+                if self.execution_date
+                else None
+            ),
+        }
+
 
-@dataclass
+@dataclass(**_SLOTTED)
 class Payment:
     """Payment status and details."""
 
@@ -422,6 +658,8 @@ class Payment:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Payment":
+        created_at = data.get("created_at")
+        executed_at = data.get("executed_at")
         return cls(
             id=data["id"],
             status=data.get("status", "pending"),
@@ -431,14 +669,10 @@ class Payment:
             creditor_iban=data.get("creditor_iban"),
             reference=data.get("reference"),
             created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if data.get("created_at")
-                else None
+                _parse_datetime(created_at) if created_at else None
             ),
             executed_at=(
-                datetime.fromisoformat(data["executed_at"])
-                if data.get("executed_at")
-                else None
+                _parse_datetime(executed_at) if executed_at else None
             ),
         )
 
@@ -453,7 +687,7 @@ class ConsentRequest:
     frequency_per_day: int = 4
 
 
-@dataclass
+@dataclass(**_SLOTTED)
 class Consent:
     """Consent status and details."""
 
@@ -466,25 +700,23 @@ class Consent:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Consent":
+        valid_until = data.get("valid_until")
+        created_at = data.get("created_at")
         return cls(
             id=data["id"],
             status=data.get("status", "pending"),
             access=data.get("access", []),
             valid_until=(
-                date.fromisoformat(data["valid_until"])
-                if data.get("valid_until")
-                else None
+                _parse_date(valid_until) if valid_until else None
             ),
             authorization_url=data.get("authorization_url"),
             created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if data.get("created_at")
-                else None
+                _parse_datetime(created_at) if created_at else None
             ),
         )
 
 
-@dataclass
+@dataclass(**_SLOTTED)
 class Institution:
     """Financial institution."""
 
@@ -493,7 +725,7 @@ class Institution:
     bic: Optional[str] = None
     country: str = ""
     logo_url: Optional[str] = None
-    supported_features: List[str] = field(default_factory=list)
+    supported_features: List[str] = _EMPTY_TUPLE  # type: ignore
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Institution":
@@ -503,11 +735,12 @@ class Institution:
             bic=data.get("bic"),
             country=data.get("country", ""),
             logo_url=data.get("logo_url"),
-            supported_features=data.get("supported_features", []),
+            supported_features=data.get("supported_features")
+            or _EMPTY_TUPLE,
         )
 
 
-@dataclass
+@dataclass(**_SLOTTED)
 class TokenResponse:
     """OAuth token response."""
 
@@ -563,6 +796,33 @@ class Page(Generic[T]):
 # =============================================================================
 
 
+_SUCCESS_STATUSES = frozenset({200, 201, 202})
+
+_RETRY_AFTER_DEFAULT = 60.0
+_RETRY_AFTER_MAX = 300.0
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Parse a Retry-After header value into seconds.
+
+    Accepts both delta-seconds and HTTP-date forms, falls back to 60s on
+    anything unparseable and caps the result so a broken server cannot
+    stall a worker indefinitely.
+    """
+    if not value:
+        return _RETRY_AFTER_DEFAULT
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (
+                parsedate_to_datetime(value) - datetime.now(timezone.utc)
+            ).total_seconds()
+        except (TypeError, ValueError):
+            return _RETRY_AFTER_DEFAULT
+    return min(max(delay, 0.0), _RETRY_AFTER_MAX)
+
+
 class HTTPClient:
     """Async HTTP client with retry logic."""
 
@@ -571,23 +831,52 @@ class HTTPClient:
         config: Config,
         session: Optional["aiohttp.ClientSession"] = None,
     ):
-        if aiohttp is None:
-            raise ImportError(
-                "aiohttp is required for the OpeniBank SDK. "
-                "Install it with: pip install aiohttp"
-            )
+        _load_aiohttp()
 
         self.config = config
         self._session = session
         self._owned_session = session is None
+        self._url_prefix = f"{config.base_url}/{config.api_version}"
+        self._token_url = f"{config.base_url}/oauth/token"
+        # Static for the lifetime of the client; built once instead of
+        # on every token refresh.
+        self._token_body = {
+            "grant_type": "client_credentials",
+            "client_id": config.client_id,
+            "client_secret": config.client_secret,
+        }
+        self._backoff = tuple(
+            config.retry_delay * (1 << i) for i in range(config.max_retries)
+        )
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0
+        self._headers_token: Optional[str] = None
+        self._cached_headers: Dict[str, str] = {}
+        # Created lazily so the constructor works without a running loop.
+        self._token_lock: Optional[asyncio.Lock] = None
 
     async def _get_session(self) -> "aiohttp.ClientSession":
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
+            shared = self.config.shared_session
+            if shared is not None and not shared.closed:
+                self._session = shared
+                self._owned_session = False
+                return shared
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # All traffic goes to a single host, so size the pool per
+            # host and keep DNS results warm between bursts.
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.config.pool_limit,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                json_serialize=_json_dumps,
+            )
             self._owned_session = True
         return self._session
 
@@ -600,12 +889,28 @@ class HTTPClient:
     def set_access_token(self, token: str, expires_in: int = 3600) -> None:
         """Set the access token."""
         self._access_token = token
-        self._token_expires_at = time.time() + expires_in - 60  # 60s buffer
+        # Monotonic so NTP adjustments can't extend or cut token life.
+        self._token_expires_at = (
+            time.monotonic() + expires_in - 60  # 60s buffer
+        )
+        self._headers_token = token
+        self._cached_headers = self._build_headers(token)
+
+    def _cached_token(self) -> Optional[str]:
+        """Return the cached access token if still valid, else None.
+
+        Synchronous so the request hot path can skip creating an
+        _ensure_token coroutine when the token is already good.
+        """
+        if self._access_token and time.monotonic() < self._token_expires_at:
+            return self._access_token
+        return None
 
     async def _ensure_token(self) -> str:
         """Ensure we have a valid access token."""
-        if self._access_token and time.time() < self._token_expires_at:
-            return self._access_token
+        token = self._cached_token()
+        if token:
+            return token
 
         # Use API key if available
         if self.config.api_key:
@@ -613,37 +918,51 @@ class HTTPClient:
 
         # Get new token using client credentials
         if self.config.client_id and self.config.client_secret:
-            token_response = await self._request_token()
-            self.set_access_token(
-                token_response.access_token,
-                token_response.expires_in,
-            )
-            return self._access_token  # type: ignore
+            if self._token_lock is None:
+                self._token_lock = asyncio.Lock()
+            async with self._token_lock:
+                # Another coroutine may have refreshed the token while
+                # we waited for the lock.
+                if (
+                    self._access_token
+                    and time.monotonic() < self._token_expires_at
+                ):
+                    return self._access_token
+                token_response = await self._request_token()
+                self.set_access_token(
+                    token_response.access_token,
+                    token_response.expires_in,
+                )
+                return self._access_token  # type: ignore
 
         raise AuthenticationError("No valid credentials configured")
 
     async def _request_token(self) -> TokenResponse:
         """Request access token using client credentials."""
         session = await self._get_session()
-        url = f"{self.config.base_url}/oauth/token"
 
         async with session.post(
-            url,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self.config.client_id,
-                "client_secret": self.config.client_secret,
-            },
+            self._token_url,
+            data=self._token_body,
         ) as response:
             if response.status != 200:
                 raise AuthenticationError(
                     f"Failed to obtain access token: {response.status}"
                 )
-            data = await response.json()
+            data = _json_loads(await response.read())
             return TokenResponse.from_dict(data)
 
-    def _get_headers(self, token: str) -> Dict[str, str]:
-        """Get request headers."""
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff delay for a retry attempt, with up to 25% jitter.
+
+        Jitter keeps a fleet of rate-limited clients from retrying in
+        lockstep.
+        """
+        base = self._backoff[attempt]
+        return base + random.random() * base * 0.25
+
+    def _build_headers(self, token: str) -> Dict[str, str]:
+        """Build request headers for a token."""
         return {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
@@ -652,26 +971,100 @@ class HTTPClient:
             "User-Agent": f"OpeniBank-Python/{__version__}",
         }
 
+    def _get_headers(self, token: str) -> Dict[str, str]:
+        """Get request headers, rebuilt only when the token rotates."""
+        if token != self._headers_token:
+            self._headers_token = token
+            self._cached_headers = self._build_headers(token)
+        return self._cached_headers
+
+    async def _raise_api_error(self, response: Any) -> None:
+        """Read an error body and raise the mapped exception."""
+        request_id = response.headers.get("X-Request-ID")
+
+        try:
+            error_data = await response.json(loads=_json_loads)
+        except Exception:
+            error_data = {"message": await response.text()}
+
+        error_message = error_data.get("message", "Unknown error")
+
+        exc_cls = _ERROR_MAP.get(response.status)
+        if exc_cls is None:
+            exc_cls = (
+                ServerError if response.status >= 500 else OpeniBankError
+            )
+
+        kwargs: Dict[str, Any] = {
+            "code": error_data.get("code"),
+            "status_code": response.status,
+            "request_id": request_id,
+        }
+        for extra in _ERROR_EXTRA_FIELDS.get(exc_cls, ()):
+            kwargs[extra] = error_data.get(extra)
+        if exc_cls is RateLimitError:
+            kwargs["retry_after"] = _parse_retry_after(
+                response.headers.get("Retry-After")
+            )
+
+        raise exc_cls(error_message, **kwargs)
+
     async def request(
         self,
         method: str,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
         idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Make an HTTP request with retry logic."""
+        """Make an HTTP request with retry logic.
+
+        Bodies may be passed either as a dict via ``json`` or
+        pre-serialized as bytes via ``data``; the default Content-Type
+        header already declares application/json.
+        """
+        body = await self.request_raw(
+            method,
+            path,
+            params=params,
+            json=json,
+            data=data,
+            idempotency_key=idempotency_key,
+        )
+        if not body:
+            return _EMPTY_DICT
+        return _json_loads(body)
+
+    async def request_raw(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> bytes:
+        """Make an HTTP request and return the raw response body.
+
+        The body bytes are handed to the caller undecoded, so the JSON
+        tree is built exactly once, by whichever decoder the caller
+        picks; 204 responses yield b"".
+        """
         session = await self._get_session()
-        token = await self._ensure_token()
+        token = self._cached_token() or await self._ensure_token()
         headers = self._get_headers(token)
 
         if idempotency_key:
+            # Copy so the cached dict is never mutated.
+            headers = dict(headers)
             headers["Idempotency-Key"] = idempotency_key
 
-        url = f"{self.config.base_url}/{self.config.api_version}{path}"
+        url = self._url_prefix + path
 
-        # Filter out None values from params
-        if params:
+        # Filter out None values from params; reuse the dict untouched
+        # in the common all-present case.
+        if params and any(v is None for v in params.values()):
             params = {k: v for k, v in params.items() if v is not None}
 
         last_error: Optional[Exception] = None
@@ -683,94 +1076,21 @@ class HTTPClient:
                     url,
                     params=params,
                     json=json,
+                    data=data,
                     headers=headers,
                 ) as response:
-                    request_id = response.headers.get("X-Request-ID")
-
-                    if response.status == 200 or response.status == 201:
-                        return await response.json()
+                    if response.status in _SUCCESS_STATUSES:
+                        return await response.read()
 
                     if response.status == 204:
-                        return {}
-
-                    # Handle errors
-                    try:
-                        error_data = await response.json()
-                    except Exception:
-                        error_data = {"message": await response.text()}
-
-                    error_message = error_data.get("message", "Unknown error")
-                    error_code = error_data.get("code")
-
-                    if response.status == 401:
-                        raise AuthenticationError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                        )
-                    elif response.status == 403:
-                        raise AuthorizationError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                            required_scopes=error_data.get("required_scopes"),
-                        )
-                    elif response.status == 400:
-                        raise ValidationError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                            errors=error_data.get("errors"),
-                        )
-                    elif response.status == 404:
-                        raise NotFoundError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                            resource_type=error_data.get("resource_type"),
-                            resource_id=error_data.get("resource_id"),
-                        )
-                    elif response.status == 409:
-                        raise ConflictError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                        )
-                    elif response.status == 429:
-                        retry_after = float(
-                            response.headers.get("Retry-After", "60")
-                        )
-                        raise RateLimitError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                            retry_after=retry_after,
-                        )
-                    elif response.status >= 500:
-                        raise ServerError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                        )
-                    else:
-                        raise OpeniBankError(
-                            error_message,
-                            code=error_code,
-                            status_code=response.status,
-                            request_id=request_id,
-                        )
+                        return b""
+
+                    await self._raise_api_error(response)
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 last_error = NetworkError(f"Network error: {str(e)}")
                 if attempt < self.config.max_retries - 1:
-                    delay = self.config.retry_delay * (2**attempt)
+                    delay = self._retry_delay(attempt)
                     logger.warning(
                         f"Request failed, retrying in {delay}s: {e}"
                     )
@@ -784,7 +1104,7 @@ class HTTPClient:
                     delay = (
                         e.retry_after
                         if isinstance(e, RateLimitError)
-                        else self.config.retry_delay * (2**attempt)
+                        else self._retry_delay(attempt)
                     )
                     logger.warning(
                         f"Request failed, retrying in {delay}s: {e}"
@@ -797,11 +1117,68 @@ class HTTPClient:
             raise last_error
         raise NetworkError("Request failed after all retries")
 
+    async def _request_stream_items(
+        self,
+        method: str,
+        path: str,
+        item_key: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream items of a large list response one at a time.
+
+        Parses the body incrementally with ijson so peak memory stays
+        bounded by a single item instead of the full page plus its
+        decoded JSON tree. Falls back to a buffered request() when ijson
+        is not installed.
+        """
+        if ijson is None:
+            data = await self.request(method, path, params=params)
+            for item in data.get(item_key, []):
+                yield item
+            return
+
+        session = await self._get_session()
+        token = self._cached_token() or await self._ensure_token()
+        headers = self._get_headers(token)
+        url = self._url_prefix + path
+
+        if params and any(v is None for v in params.values()):
+            params = {k: v for k, v in params.items() if v is not None}
+
+        async with session.request(
+            method, url, params=params, headers=headers
+        ) as response:
+            if response.status == 204:
+                return
+            if response.status not in _SUCCESS_STATUSES:
+                await self._raise_api_error(response)
+            async for item in ijson.items_async(
+                response.content, f"{item_key}.item"
+            ):
+                yield item
+
 
 # =============================================================================
 # API Resources
 # =============================================================================
 
+def _drop_none(**params: Any) -> Dict[str, Any]:
+    """Build a query-params dict with unset values removed.
+
+    Filtering at the resource layer keeps Nones out of the HTTP layer
+    entirely and unset filters out of the query string.
+    """
+    return {k: v for k, v in params.items() if v is not None}
+
+
+# Hot-path URL fragments. Concatenating a few interned constants avoids
+# the per-call FORMAT_VALUE/BUILD_STRING work of f-string assembly in
+# the busiest resource methods.
+_P_ACCT = "/accounts/"
+_P_TXS = "/transactions"
+_P_TX = "/transactions/"
+_P_BAL = "/balances"
+
 
 class AccountsResource:
     """Accounts API resource."""
@@ -820,26 +1197,45 @@ class AccountsResource:
         data = await self._http.request(
             "GET",
             "/accounts",
-            params={
-                "status": status,
-                "account_type": account_type,
-                "limit": limit,
-                "offset": offset,
-            },
+            params=_drop_none(
+                status=status,
+                account_type=account_type,
+                limit=limit,
+                offset=offset,
+            ),
         )
-        return [Account.from_dict(item) for item in data.get("accounts", [])]
+        return [Account.from_dict(item) for item in data.get("accounts") or ()]
 
     async def get(self, account_id: str) -> Account:
         """Get a single account."""
-        data = await self._http.request("GET", f"/accounts/{account_id}")
+        data = await self._http.request("GET", _P_ACCT + account_id)
         return Account.from_dict(data)
 
+    async def get_many(
+        self, account_ids: List[str], concurrency: int = 16
+    ) -> List[Account]:
+        """Fetch several accounts concurrently.
+
+        Fans out the lookups with a bounded number of in-flight
+        requests so N accounts cost roughly one round-trip instead of
+        N. Results keep the input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _get(account_id: str) -> Account:
+            async with semaphore:
+                return await self.get(account_id)
+
+        return list(
+            await asyncio.gather(*(_get(i) for i in account_ids))
+        )
+
     async def get_balances(self, account_id: str) -> List[Balance]:
         """Get account balances."""
         data = await self._http.request(
-            "GET", f"/accounts/{account_id}/balances"
+            "GET", _P_ACCT + account_id + _P_BAL
         )
-        return [Balance.from_dict(item) for item in data.get("balances", [])]
+        return [Balance.from_dict(item) for item in data.get("balances") or ()]
 
 
 class TransactionsResource:
@@ -862,21 +1258,18 @@ class TransactionsResource:
         """List transactions for an account."""
         data = await self._http.request(
             "GET",
-            f"/accounts/{account_id}/transactions",
-            params={
-                "date_from": date_from.isoformat() if date_from else None,
-                "date_to": date_to.isoformat() if date_to else None,
-                "amount_min": amount_min,
-                "amount_max": amount_max,
-                "booking_status": booking_status,
-                "limit": limit,
-                "offset": offset,
-            },
+            _P_ACCT + account_id + _P_TXS,
+            params=_drop_none(
+                date_from=date_from.isoformat() if date_from else None,
+                date_to=date_to.isoformat() if date_to else None,
+                amount_min=amount_min,
+                amount_max=amount_max,
+                booking_status=booking_status,
+                limit=limit,
+                offset=offset,
+            ),
         )
-        return [
-            Transaction.from_dict(item)
-            for item in data.get("transactions", [])
-        ]
+        return Transaction.from_list(data.get("transactions") or ())
 
     async def get(
         self, account_id: str, transaction_id: str
@@ -884,10 +1277,31 @@ class TransactionsResource:
         """Get a single transaction."""
         data = await self._http.request(
             "GET",
-            f"/accounts/{account_id}/transactions/{transaction_id}",
+            _P_ACCT + account_id + _P_TX + transaction_id,
         )
         return Transaction.from_dict(data)
 
+    async def get_many(
+        self,
+        account_id: str,
+        transaction_ids: List[str],
+        concurrency: int = 16,
+    ) -> List[Transaction]:
+        """Fetch several transactions concurrently.
+
+        Fans out the lookups with a bounded number of in-flight
+        requests; results keep the input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _get(transaction_id: str) -> Transaction:
+            async with semaphore:
+                return await self.get(account_id, transaction_id)
+
+        return list(
+            await asyncio.gather(*(_get(i) for i in transaction_ids))
+        )
+
     async def iterate(
         self,
         account_id: str,
@@ -895,21 +1309,76 @@ class TransactionsResource:
         date_to: Optional[date] = None,
         limit: int = 50,
     ) -> AsyncIterator[Transaction]:
-        """Iterate through all transactions."""
+        """Iterate through all transactions.
+
+        The next page is requested as soon as the current one arrives,
+        so the HTTP round-trip overlaps with the caller consuming rows.
+        """
+
+        def _fetch(offset: int) -> "asyncio.Task[List[Transaction]]":
+            return asyncio.create_task(
+                self.list(
+                    account_id=account_id,
+                    date_from=date_from,
+                    date_to=date_to,
+                    limit=limit,
+                    offset=offset,
+                )
+            )
+
+        offset = 0
+        next_task: Optional["asyncio.Task[List[Transaction]]"] = _fetch(
+            offset
+        )
+        try:
+            while next_task is not None:
+                transactions = await next_task
+                next_task = None
+                if not transactions:
+                    break
+                if len(transactions) == limit:
+                    offset += limit
+                    next_task = _fetch(offset)
+                for tx in transactions:
+                    yield tx
+        finally:
+            # Don't leak the in-flight prefetch if the consumer stops
+            # iterating early.
+            if next_task is not None:
+                next_task.cancel()
+
+    async def stream(
+        self,
+        account_id: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 500,
+    ) -> AsyncIterator[Transaction]:
+        """Stream all transactions with bounded peak memory.
+
+        Like iterate(), but each page body is decoded incrementally
+        (with ijson, via the streaming extra), so memory stays at one
+        transaction rather than a full page plus its JSON tree. Without
+        ijson installed this falls back to buffered pages.
+        """
+        path = _P_ACCT + account_id + _P_TXS
         offset = 0
         while True:
-            transactions = await self.list(
-                account_id=account_id,
-                date_from=date_from,
-                date_to=date_to,
-                limit=limit,
-                offset=offset,
-            )
-            if not transactions:
-                break
-            for tx in transactions:
-                yield tx
-            if len(transactions) < limit:
+            count = 0
+            async for item in self._http._request_stream_items(
+                "GET",
+                path,
+                "transactions",
+                params=_drop_none(
+                    date_from=date_from.isoformat() if date_from else None,
+                    date_to=date_to.isoformat() if date_to else None,
+                    limit=limit,
+                    offset=offset,
+                ),
+            ):
+                count += 1
+                yield Transaction.from_dict(item)
+            if count < limit:
                 break
             offset += limit
 
@@ -929,27 +1398,7 @@ class PaymentsResource:
         data = await self._http.request(
             "POST",
             "/payments",
-            json={
-                "creditor": {
-                    "name": payment.creditor.name,
-                    "account": {
-                        "iban": payment.creditor.account.iban,
-                        "bban": payment.creditor.account.bban,
-                    },
-                },
-                "amount": {
-                    "amount": payment.amount.amount,
-                    "currency": payment.amount.currency,
-                },
-                "debtor_account_id": payment.debtor_account_id,
-                "reference": payment.reference,
-                "end_to_end_id": payment.end_to_end_id,
-                "execution_date": (
-                    payment.execution_date.isoformat()
-                    if payment.execution_date
-                    else None
-                ),
-            },
+            data=_json_dumps_bytes(payment.to_payload()),
             idempotency_key=idempotency_key,
         )
         return Payment.from_dict(data)
@@ -969,13 +1418,9 @@ class PaymentsResource:
         data = await self._http.request(
             "GET",
             "/payments",
-            params={
-                "status": status,
-                "limit": limit,
-                "offset": offset,
-            },
+            params=_drop_none(status=status, limit=limit, offset=offset),
         )
-        return [Payment.from_dict(item) for item in data.get("payments", [])]
+        return [Payment.from_dict(item) for item in data.get("payments") or ()]
 
     async def cancel(self, payment_id: str) -> Payment:
         """Cancel a pending payment."""
@@ -1017,7 +1462,7 @@ class ConsentsResource:
     async def list(self) -> List[Consent]:
         """List all consents."""
         data = await self._http.request("GET", "/consents")
-        return [Consent.from_dict(item) for item in data.get("consents", [])]
+        return [Consent.from_dict(item) for item in data.get("consents") or ()]
 
 
 class InstitutionsResource:
@@ -1037,16 +1482,16 @@ class InstitutionsResource:
         data = await self._http.request(
             "GET",
             "/institutions",
-            params={
-                "country": country,
-                "query": query,
-                "limit": limit,
-                "offset": offset,
-            },
+            params=_drop_none(
+                country=country,
+                query=query,
+                limit=limit,
+                offset=offset,
+            ),
         )
         return [
             Institution.from_dict(item)
-            for item in data.get("institutions", [])
+            for item in data.get("institutions") or ()
         ]
 
     async def get(self, institution_id: str) -> Institution:
@@ -1063,6 +1508,17 @@ class AuthResource:
     def __init__(self, http: HTTPClient, config: Config):
         self._http = http
         self._config = config
+        # None of these change for the lifetime of the client.
+        self._authorize_url = f"{config.base_url}/oauth/authorize"
+        self._token_url = f"{config.base_url}/oauth/token"
+        self._auth_base_params = {
+            "client_id": config.client_id,
+            "response_type": "code",
+        }
+        self._token_body_base = {
+            "client_id": config.client_id,
+            "client_secret": config.client_secret,
+        }
 
     def get_authorization_url(
         self,
@@ -1071,19 +1527,15 @@ class AuthResource:
         state: Optional[str] = None,
     ) -> str:
         """Generate OAuth authorization URL."""
-        import urllib.parse
-
         params = {
-            "client_id": self._config.client_id,
+            **self._auth_base_params,
             "redirect_uri": redirect_uri,
-            "response_type": "code",
             "scope": " ".join(scopes),
         }
         if state:
             params["state"] = state
 
-        query = urllib.parse.urlencode(params)
-        return f"{self._config.base_url}/oauth/authorize?{query}"
+        return f"{self._authorize_url}?{urlencode(params)}"
 
     async def exchange_code(
         self,
@@ -1091,51 +1543,63 @@ class AuthResource:
         redirect_uri: str,
     ) -> TokenResponse:
         """Exchange authorization code for tokens."""
-        if aiohttp is None:
-            raise ImportError("aiohttp is required")
-
         session = await self._http._get_session()
-        url = f"{self._config.base_url}/oauth/token"
 
         async with session.post(
-            url,
+            self._token_url,
             data={
+                **self._token_body_base,
                 "grant_type": "authorization_code",
-                "client_id": self._config.client_id,
-                "client_secret": self._config.client_secret,
                 "code": code,
                 "redirect_uri": redirect_uri,
             },
         ) as response:
             if response.status != 200:
+                # Skip the read only on a declared-empty body; None
+                # means chunked/unknown length and may still carry one.
+                if response.content_length == 0:
+                    raise AuthenticationError(
+                        f"Failed to exchange code: {response.status}"
+                    )
+                body = await response.read()
+                if not body:
+                    raise AuthenticationError(
+                        f"Failed to exchange code: {response.status}"
+                    )
                 raise AuthenticationError(
-                    f"Failed to exchange code: {response.status}"
+                    f"Failed to exchange code: {response.status}: {body!r}"
                 )
-            data = await response.json()
+            data = _json_loads(await response.read())
             return TokenResponse.from_dict(data)
 
     async def refresh_token(self, refresh_token: str) -> TokenResponse:
         """Refresh access token."""
-        if aiohttp is None:
-            raise ImportError("aiohttp is required")
-
         session = await self._http._get_session()
-        url = f"{self._config.base_url}/oauth/token"
 
         async with session.post(
-            url,
+            self._token_url,
             data={
+                **self._token_body_base,
                 "grant_type": "refresh_token",
-                "client_id": self._config.client_id,
-                "client_secret": self._config.client_secret,
                 "refresh_token": refresh_token,
             },
         ) as response:
             if response.status != 200:
+                # Skip the read only on a declared-empty body; None
+                # means chunked/unknown length and may still carry one.
+                if response.content_length == 0:
+                    raise AuthenticationError(
+                        f"Failed to refresh token: {response.status}"
+                    )
+                body = await response.read()
+                if not body:
+                    raise AuthenticationError(
+                        f"Failed to refresh token: {response.status}"
+                    )
                 raise AuthenticationError(
-                    f"Failed to refresh token: {response.status}"
+                    f"Failed to refresh token: {response.status}: {body!r}"
                 )
-            data = await response.json()
+            data = _json_loads(await response.read())
             return TokenResponse.from_dict(data)
 
 
@@ -1154,6 +1618,53 @@ class EventType(str, Enum):
     CONSENT_REVOKED = "consent.revoked"
 
 
+# Enum .value access goes through a descriptor on every read; freeze the
+# member -> string table once for dispatch and payload building.
+_EVENT_VALUES: Dict[EventType, str] = {e: e.value for e in EventType}
+
+
+@lru_cache(maxsize=64)
+def _subscribe_message(account_id: str, event_values: tuple) -> str:
+    """Pre-serialized subscribe payload, cached per subscription shape."""
+    return _json_dumps(
+        {
+            "action": "subscribe",
+            "account_id": account_id,
+            "events": list(event_values),
+        }
+    )
+
+
+def batched_handler(
+    func: Callable[[List["RealtimeEvent"]], Coroutine[Any, Any, None]],
+) -> Callable[[List["RealtimeEvent"]], Coroutine[Any, Any, None]]:
+    """Mark an event handler as batch-capable.
+
+    A batched handler receives a list of events instead of a single
+    event: when a burst of same-type messages is already buffered on
+    the socket, the read loop drains them and makes one handler call
+    for the whole run instead of one per message.
+    """
+    func.__batch__ = True  # type: ignore[attr-defined]
+    return func
+
+
+def _queued_messages(ws: Any) -> int:
+    """Best-effort count of messages already buffered on the socket.
+
+    websockets exposes the receive buffer as `messages` (a deque or a
+    queue depending on version); anything without one reports zero and
+    disables draining.
+    """
+    queue = getattr(ws, "messages", None)
+    if queue is None:
+        return 0
+    try:
+        return queue.qsize()
+    except AttributeError:
+        return len(queue)
+
+
 @dataclass
 class RealtimeEvent:
     """Real-time event."""
@@ -1170,57 +1681,336 @@ class Subscription:
         self,
         ws: Any,
         handlers: Dict[str, Callable[[RealtimeEvent], Coroutine[Any, Any, None]]],
+        ordered: bool = False,
+        max_concurrency: int = 16,
+        batch_max: int = 64,
+        unsubscribe: Optional[Callable[[], Coroutine[Any, Any, None]]] = None,
     ):
         self._ws = ws
         self._handlers = handlers
+        self._ordered = ordered
+        self._max_concurrency = max_concurrency
+        self._batch_max = batch_max
+        # Set when the socket is shared: close() unsubscribes instead of
+        # tearing the connection down.
+        self._unsubscribe = unsubscribe
         self._running = False
         self._task: Optional[asyncio.Task[None]] = None
+        # Shared-socket router task, anchored here so wait() can await
+        # it and surface its failure. Never cancelled by close(): it
+        # outlives any one subscription.
+        self._mux_task: Optional[asyncio.Task[None]] = None
+        self._handler_tasks: set = set()
+        # Created lazily inside the running loop.
+        self._handler_limit: Optional[asyncio.Semaphore] = None
+
+    def _dispatch(
+        self,
+        handler: Callable[..., Coroutine[Any, Any, None]],
+        event: Union[RealtimeEvent, List[RealtimeEvent]],
+    ) -> None:
+        """Run a handler in the background.
+
+        The read loop keeps draining the socket while handlers run; a
+        semaphore bounds how many run at once. Task references are held
+        until completion so they cannot be garbage collected mid-flight.
+        """
+        if self._handler_limit is None:
+            self._handler_limit = asyncio.Semaphore(self._max_concurrency)
+
+        async def _run() -> None:
+            async with self._handler_limit:  # type: ignore[union-attr]
+                try:
+                    await handler(event)
+                except Exception:
+                    logger.exception("Event handler failed")
+
+        task = asyncio.create_task(_run())
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    def _parse_event(
+        self, data: Dict[str, Any], event_type: str
+    ) -> RealtimeEvent:
+        timestamp = data.get("timestamp")
+        return RealtimeEvent(
+            type=event_type,
+            data=data.get("data"),
+            timestamp=(
+                _parse_datetime(timestamp) if timestamp else datetime.now()
+            ),
+        )
+
+    async def _deliver(
+        self,
+        handler: Callable[..., Coroutine[Any, Any, None]],
+        event: Union[RealtimeEvent, List[RealtimeEvent]],
+    ) -> None:
+        """Deliver an event or batch per this subscription's ordering."""
+        if self._ordered:
+            await handler(event)
+        else:
+            self._dispatch(handler, event)
+
+    async def _handle_event(
+        self,
+        handler: Callable[..., Coroutine[Any, Any, None]],
+        event: RealtimeEvent,
+        data: Dict[str, Any],
+        resolve: Callable[
+            [Dict[str, Any]],
+            Tuple[Optional["Subscription"], Optional[Callable[..., Any]], str],
+        ],
+        key_of: Callable[[Dict[str, Any]], Any],
+    ) -> None:
+        """Deliver one decoded frame, draining a burst when possible.
+
+        For handlers marked with @batched_handler, frames already
+        buffered on the socket that resolve to the same route are
+        pulled into one list (up to batch_max) and delivered in a
+        single handler call, amortizing the scheduler round-trip per
+        message across the run. `resolve` maps a decoded frame to its
+        (subscription, handler, event type); `key_of` extracts the
+        route key that decides whether a frame extends the run.
+        """
+        if not getattr(handler, "__batch__", False):
+            await self._deliver(handler, event)
+            return
+
+        loads = _json_loads
+        recv = getattr(self._ws, "recv", None)
+        key = key_of(data)
+        batch = [event]
+        pending = None
+        while (
+            recv is not None
+            and len(batch) < self._batch_max
+            and _queued_messages(self._ws) > 0
+        ):
+            data = loads(await recv())
+            next_sub, next_handler, next_type = resolve(data)
+            if next_handler is handler and key_of(data) == key:
+                batch.append(self._parse_event(data, next_type))
+                continue
+            # A different route ends the run; flush the batch first so
+            # delivery order is preserved.
+            if next_handler is not None:
+                pending = (
+                    next_sub,
+                    next_handler,
+                    next_sub._parse_event(data, next_type),
+                )
+            break
+
+        await self._deliver(handler, batch)
+
+        if pending is not None:
+            next_sub, next_handler, next_event = pending
+            payload = (
+                [next_event]
+                if getattr(next_handler, "__batch__", False)
+                else next_event
+            )
+            await next_sub._deliver(next_handler, payload)
 
     async def _process_messages(self) -> None:
-        """Process incoming WebSocket messages."""
+        """Process incoming WebSocket messages on a dedicated socket."""
         self._running = True
+        # Hot loop: bind lookups once, one frame decode per message.
+        loads = _json_loads
+        get_handler = self._handlers.get
+
+        def _resolve(
+            data: Dict[str, Any],
+        ) -> Tuple[
+            Optional["Subscription"], Optional[Callable[..., Any]], str
+        ]:
+            event_type = data.get("type")
+            return self, get_handler(event_type), event_type
+
+        def _key(data: Dict[str, Any]) -> Any:
+            return data.get("type")
+
         try:
             async for message in self._ws:
                 if not self._running:
                     break
 
-                import json
-
-                data = json.loads(message)
+                data = loads(message)
                 event_type = data.get("type")
-                handler = self._handlers.get(event_type)
-
-                if handler:
-                    event = RealtimeEvent(
-                        type=event_type,
-                        data=data.get("data"),
-                        timestamp=datetime.fromisoformat(
-                            data.get("timestamp", datetime.now().isoformat())
-                        ),
-                    )
-                    await handler(event)
+                handler = get_handler(event_type)
+                if handler is None:
+                    continue
+
+                await self._handle_event(
+                    handler,
+                    self._parse_event(data, event_type),
+                    data,
+                    _resolve,
+                    _key,
+                )
         except Exception as e:
             logger.error(f"WebSocket error: {e}")
             raise
 
     async def wait(self) -> None:
-        """Wait for subscription to complete."""
-        if self._task:
-            await self._task
+        """Wait for subscription to complete.
+
+        Awaits whichever read loop serves this subscription — its own
+        task or the shared-socket router — so a loop crash propagates
+        here instead of going unobserved.
+        """
+        task = self._task or self._mux_task
+        if task is not None:
+            await task
 
     async def close(self) -> None:
-        """Close the subscription."""
+        """Close the subscription.
+
+        Shuts down in order: stop the read loop, unsubscribe (or close
+        the socket when it is owned), then drain in-flight handlers so
+        no work is abandoned mid-event.
+        """
         self._running = False
-        if self._ws:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._unsubscribe is not None:
+            await self._unsubscribe()
+        elif self._ws:
             await self._ws.close()
+        if self._handler_tasks:
+            await asyncio.gather(
+                *self._handler_tasks, return_exceptions=True
+            )
+
+    async def __aenter__(self) -> "Subscription":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Any,
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
 
 
 class RealtimeResource:
-    """Real-time WebSocket resource."""
+    """Real-time WebSocket resource.
+
+    All subscriptions share a single WebSocket connection: the first
+    subscribe() opens the socket and starts one read loop that routes
+    frames by (account_id, event type); later calls only send the
+    subscribe message, avoiding a TLS + WebSocket handshake per account.
+    """
 
     def __init__(self, http: HTTPClient, config: Config):
         self._http = http
         self._config = config
+        self._ws: Optional[Any] = None
+        self._router: Dict[Tuple[Optional[str], str], Subscription] = {}
+        self._mux_task: Optional["asyncio.Task[None]"] = None
+        # Created lazily inside the running loop.
+        self._ws_lock: Optional[asyncio.Lock] = None
+
+    def _live_ws(self) -> Optional[Any]:
+        """The shared socket, or None if absent or its router died."""
+        if (
+            self._ws is not None
+            and self._mux_task is not None
+            and not self._mux_task.done()
+        ):
+            return self._ws
+        return None
+
+    async def _ensure_ws(self) -> Any:
+        """Open the shared socket and start the router on first use.
+
+        Single-flight: concurrent first subscribes race through the
+        awaits in here, so the connect is serialized behind a lock with
+        a re-check, like the token refresh path.
+        """
+        ws = self._live_ws()
+        if ws is not None:
+            return ws
+        if self._ws_lock is None:
+            self._ws_lock = asyncio.Lock()
+        async with self._ws_lock:
+            # Another coroutine may have connected while we waited for
+            # the lock.
+            ws = self._live_ws()
+            if ws is not None:
+                return ws
+            if self._ws is not None:
+                # The router died; close the stale socket before
+                # reconnecting instead of leaking the connection.
+                with contextlib.suppress(Exception):
+                    await self._ws.close()
+                self._ws = None
+            ws_lib = _load_websockets()
+
+            token = await self._http._ensure_token()
+            url = f"{self._config.websocket_url}/subscribe"
+
+            self._ws = await ws_lib.connect(
+                url,
+                extra_headers={
+                    "Authorization": f"Bearer {token}",
+                    "X-API-Version": self._config.api_version,
+                },
+            )
+            self._mux_task = asyncio.create_task(self._multiplex_loop())
+            return self._ws
+
+    def _route(
+        self, data: Dict[str, Any]
+    ) -> Tuple[Optional[Subscription], Optional[Callable[..., Any]], str]:
+        """Resolve a decoded frame to its subscription and handler."""
+        event_type = data.get("type")
+        subscription = self._router.get((data.get("account_id"), event_type))
+        if subscription is None:
+            return None, None, event_type
+        return (
+            subscription,
+            subscription._handlers.get(event_type),
+            event_type,
+        )
+
+    async def _multiplex_loop(self) -> None:
+        """Read every frame on the shared socket and route it.
+
+        Batched-handler bursts are drained by the shared
+        Subscription._handle_event helper, keyed on
+        (account_id, event type).
+        """
+        # Hot loop: bind lookups once, one frame decode per message.
+        loads = _json_loads
+
+        def _key(data: Dict[str, Any]) -> Any:
+            return (data.get("account_id"), data.get("type"))
+
+        try:
+            async for message in self._ws:
+                data = loads(message)
+                subscription, handler, event_type = self._route(data)
+                if handler is None:
+                    continue
+
+                await subscription._handle_event(
+                    handler,
+                    subscription._parse_event(data, event_type),
+                    data,
+                    self._route,
+                    _key,
+                )
+        except Exception as e:
+            logger.error(f"WebSocket error: {e}")
+            raise
 
     async def subscribe(
         self,
@@ -1229,48 +2019,69 @@ class RealtimeResource:
         handlers: Dict[
             EventType, Callable[[RealtimeEvent], Coroutine[Any, Any, None]]
         ],
+        ordered: bool = False,
+        batch_max: int = 64,
     ) -> Subscription:
-        """Subscribe to real-time events."""
-        if websockets is None:
-            raise ImportError(
-                "websockets is required for real-time features. "
-                "Install it with: pip install openibank[websocket]"
-            )
+        """Subscribe to real-time events.
 
-        token = await self._http._ensure_token()
-        url = f"{self._config.websocket_url}/subscribe"
+        Handlers run concurrently by default so a slow handler does not
+        stall the socket read loop; pass ordered=True to await each
+        handler in message order instead. Handlers decorated with
+        @batched_handler receive up to batch_max buffered events per
+        call.
 
-        ws = await websockets.connect(
-            url,
-            extra_headers={
-                "Authorization": f"Bearer {token}",
-                "X-API-Version": self._config.api_version,
-            },
-        )
+        Closing the returned subscription unsubscribes the account but
+        leaves the shared socket open; call close() on this resource to
+        tear the connection down.
+        """
+        ws = await self._ensure_ws()
 
         # Send subscription request
-        import json
-
         await ws.send(
-            json.dumps(
-                {
-                    "action": "subscribe",
-                    "account_id": account_id,
-                    "events": [e.value for e in events],
-                }
+            _subscribe_message(
+                account_id, tuple(_EVENT_VALUES[e] for e in events)
             )
         )
 
         # Convert handlers to use string keys
-        str_handlers = {k.value: v for k, v in handlers.items()}
+        str_handlers = {_EVENT_VALUES[k]: v for k, v in handlers.items()}
+        routes = [(account_id, value) for value in str_handlers]
+
+        async def _unsubscribe() -> None:
+            for key in routes:
+                self._router.pop(key, None)
+            if self._ws is not None:
+                await self._ws.send(
+                    _json_dumps(
+                        {"action": "unsubscribe", "account_id": account_id}
+                    )
+                )
 
-        subscription = Subscription(ws, str_handlers)
-        subscription._task = asyncio.create_task(
-            subscription._process_messages()
+        subscription = Subscription(
+            ws,
+            str_handlers,
+            ordered=ordered,
+            batch_max=batch_max,
+            unsubscribe=_unsubscribe,
         )
+        subscription._mux_task = self._mux_task
+        for key in routes:
+            self._router[key] = subscription
 
         return subscription
 
+    async def close(self) -> None:
+        """Close the shared WebSocket and drop all subscriptions."""
+        self._router.clear()
+        if self._mux_task is not None:
+            self._mux_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._mux_task
+            self._mux_task = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
 
 # =============================================================================
 # Main Client
@@ -1341,6 +2152,7 @@ class OpeniBank:
 
     async def close(self) -> None:
         """Close the client and release resources."""
+        await self.realtime.close()
         await self._http.close()
 
     async def __aenter__(self) -> "OpeniBank":
@@ -1395,6 +2207,7 @@ __all__ = [
     "EventType",
     "RealtimeEvent",
     "Subscription",
+    "batched_handler",
     # Version
     "__version__",
 ]